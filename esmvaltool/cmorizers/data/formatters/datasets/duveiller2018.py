@@ -49,32 +49,21 @@ def fix_time_coord_duveiller2018(cube):
     # Rename 'Month' to 'time'
     cube.coord('Month').rename('time')
 
-    # Create arrays for storing datetime objects
-    custom_time = np.zeros((12), dtype=object)
-    custom_time_bounds = np.empty((12, 2), dtype=object)
     custom_time_units = 'days since 1950-01-01 00:00:00.0'
 
-    # Now fill the object arrays defined above with datetime objects
-    # corresponding to correct time and time_bnds
-    for i in range(custom_time_bounds.shape[0]):
-        n_month = i + 1  # we start with month number 1, at position 0
-        # Start with time_bnds
-        time_bnd_a = datetime.datetime(2010, n_month, 1)
-        if n_month == 12:
-            time_bnd_b = datetime.datetime(2011, 1, 1)
-        else:
-            time_bnd_b = datetime.datetime(2010, n_month + 1, 1)
-        # Get time 'point' from midpoint between bnd_a and bnd_b
-        time_midpoint = time_bnd_a + 0.5 * (time_bnd_b - time_bnd_a)
-        custom_time_bounds[n_month - 1, 0] = time_bnd_a
-        custom_time_bounds[n_month - 1, 1] = time_bnd_b
-        custom_time[n_month - 1] = time_midpoint
-
-    # Convert them
-    time_bnds = cf_units.date2num(custom_time_bounds, custom_time_units,
-                                  cf_units.CALENDAR_GREGORIAN)
-    time_midpoints = cf_units.date2num(custom_time, custom_time_units,
-                                       cf_units.CALENDAR_GREGORIAN)
+    # The data represent the 12 months of 2010, a non-leap year in the
+    # Gregorian calendar, so the month boundaries expressed in the units
+    # above are a closed-form integer sequence: the cumulative month
+    # lengths shifted by the fixed offset between the reference date and
+    # 2010-01-01. Computing them directly avoids building object arrays
+    # of datetimes and the slow per-element date2num conversion.
+    offset = (datetime.date(2010, 1, 1) - datetime.date(1950, 1, 1)).days
+    month_lengths = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    month_starts = offset + np.concatenate(
+        ([0], np.cumsum(month_lengths))).astype('float64')
+    time_bnds = np.column_stack([month_starts[:-1], month_starts[1:]])
+    # Get time 'points' from midpoints between the bounds
+    time_midpoints = 0.5 * (time_bnds[:, 0] + time_bnds[:, 1])
 
     # Add them to the cube
     cube.coord('time').bounds = time_bnds
@@ -91,27 +91,40 @@ For further details on obtaining daily values from ERA-Interim,
     https://confluence.ecmwf.int/display/CKB/ERA-Interim+documentation#ERA-Interimdocumentation-Monthlymeans
     https://confluence.ecmwf.int/display/CKB/ERA-Interim%3A+How+to+calculate+daily+total+precipitation
 """
+import fnmatch
 import logging
+import math
 import re
 from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
 from copy import deepcopy
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 from os import cpu_count
 from pathlib import Path
 from warnings import catch_warnings, filterwarnings
 
+import dask
 import iris
 import numpy as np
+from dask import array as da
 from esmvalcore.cmor.table import CMOR_TABLES
 from esmvalcore.preprocessor import daily_statistics, monthly_statistics
 from iris import NameConstraint
+from iris.fileformats.netcdf.loader import CHUNK_CONTROL
 
 from esmvaltool.cmorizers.data import utilities as utils
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _get_definition(project_id, mip, short_name):
+    """Look up a variable definition in the CMOR tables (cached)."""
+    return CMOR_TABLES[project_id].get_variable(mip, short_name)
+
+
 def _fix_units(cube, definition):
     """Fix issues with the units."""
     if cube.var_name in {'evspsbl', 'pr', 'prsn'}:
@@ -119,7 +132,7 @@ def _fix_units(cube, definition):
         # to kg of water per m2 per day
         cube.units = 'm'  # fix invalid units
         cube.units = cube.units * 'kg m-3 day-1'
-        cube.data = cube.core_data() * 1000.
+        cube.data = cube.lazy_data() * 1000.
     if cube.var_name in {'hfds', 'rss', 'rsds', 'rsdt', 'rlds'}:
         # Add missing 'per day'
         cube.units = cube.units * 'day-1'
@@ -130,7 +143,7 @@ def _fix_units(cube, definition):
         cube.units = cube.units * 'day-1'
         # Radiation fluxes are positive in upward direction
         cube.attributes['positive'] = 'up'
-        cube.data = cube.core_data() * -1.
+        cube.data = cube.lazy_data() * -1.
     if cube.var_name in {'rsut', 'rsutcs'}:
         # Add missing 'per day'
         cube.units = cube.units * 'day-1'
@@ -142,13 +155,13 @@ def _fix_units(cube, definition):
                          'clt-high'}:
         # Change units from fraction to percentage
         cube.units = definition.units
-        cube.data = cube.core_data() * 100.
+        cube.data = cube.lazy_data() * 100.
     if cube.var_name in {'zg', 'orog'}:
         # Divide by acceleration of gravity [m s-2],
         # required for geopotential height, see:
         # https://apps.ecmwf.int/codes/grib/param-db?id=129
         cube.units = cube.units / 'm s-2'
-        cube.data = cube.core_data() / 9.80665
+        cube.data = cube.lazy_data() / 9.80665
     if cube.var_name in {'cli', 'clw'}:
         cube.units = 'kg kg-1'
 
@@ -186,7 +199,10 @@ def _fix_coordinates(cube, definition):
         coord.standard_name = coord_def.standard_name
         coord.var_name = coord_def.out_name
         coord.long_name = coord_def.long_name
-        coord.points = coord.core_points().astype('float64')
+        # Only cast when needed to avoid copying already-float64 points
+        points = coord.core_points()
+        if points.dtype != np.float64:
+            coord.points = points.astype(np.float64, copy=False)
         if len(coord.points) > 1 and not coord.var_name == 'plev':
             coord.guess_bounds()
         if coord.var_name == 'plev':
@@ -263,10 +279,12 @@ def _compute_daily(cube):
             'rss',
             'prsn',
     }:
-        cube.coord('time').points = cube.coord('time').units.date2num([
-            cell.point - timedelta(seconds=1)
-            for cell in cube.coord('time').cells()
-        ])
+        # Subtract one second from all points in a single vectorized
+        # operation instead of converting every cell through date2num.
+        coord = cube.coord('time')
+        one_second = (coord.units.date2num(datetime(2000, 1, 1, 0, 0, 1)) -
+                      coord.units.date2num(datetime(2000, 1, 1)))
+        coord.points = coord.core_points() - one_second
 
     if cube.var_name == 'tasmax':
         cube = daily_statistics(cube, 'max')
@@ -286,13 +304,14 @@ def _compute_daily(cube):
     else:
         cube = daily_statistics(cube, 'mean')
 
-    # Correct the time coordinate
-    cube.coord('time').points = cube.coord('time').units.date2num([
-        cell.point.replace(hour=12, minute=0, second=0, microsecond=0)
-        for cell in cube.coord('time').cells()
-    ])
-    cube.coord('time').bounds = None
-    cube.coord('time').guess_bounds()
+    # Correct the time coordinate: set all points to noon of their day.
+    # The time unit is midnight-based 'days since ...' at this point (see
+    # _fix_coordinates), so this is a vectorized floor plus half a day
+    # instead of a per-cell date2num round trip.
+    coord = cube.coord('time')
+    coord.points = np.floor(coord.core_points()) + 0.5
+    coord.bounds = None
+    coord.guess_bounds()
 
     return cube
 
@@ -342,47 +361,63 @@ def _load_cube(in_files, var):
                            category=UserWarning,
                            module='iris')
 
-        if len(in_files) == 1:
-            cube = iris.load_cube(
-                in_files[0],
-                constraint=NameConstraint(var_name=var['raw']),
-            )
-        elif var.get('operator', '') == 'sum':
-            # Multiple variables case using sum operation
-            cube = None
-            for raw_name, filename in zip(var['raw'], in_files):
-                in_cube = iris.load_cube(
-                    filename,
-                    constraint=NameConstraint(var_name=raw_name),
-                )
-                if cube is None:
-                    cube = in_cube
-                else:
-                    cube += in_cube
-        elif var.get('operator', '') == 'diff':
-            # two variables case using diff operation
-            cube = None
-            elements_var = len(var['raw'])
-            elements_files = len(in_files)
-            if (elements_var != 2) or (elements_files != 2):
-                shortname = var.get('short_name')
-                errmsg = (f'operator diff selected for variable {shortname} '
-                          f'expects exactly two input variables and two input '
-                          f'files')
-                raise ValueError(errmsg)
-            cube = iris.load_cube(
-                in_files[0],
-                constraint=NameConstraint(var_name=var['raw'][0]),
-            )
-            cube2 = iris.load_cube(
-                in_files[1],
-                constraint=NameConstraint(var_name=var['raw'][1]),
-            )
-            cube -= cube2
+        # A monthly input file holds at most 12 time steps, so a whole
+        # year fits comfortably in a single chunk; loading it as one
+        # avoids a separate read per time step when the time dimension
+        # is unlimited on disk. Keyed on the input file patterns rather
+        # than the output MIP, because some monthly variables (e.g.
+        # ERA-Interim-Land sm) are computed from 6-hourly input.
+        if all('monthly' in pattern for pattern in var['files']):
+            chunk_control = CHUNK_CONTROL.set(time=-1)
         else:
-            raise ValueError(
-                "Multiple input files found, with operator '{}' configured: {}"
-                .format(var.get('operator'), ', '.join(in_files)))
+            chunk_control = nullcontext()
+
+        with chunk_control:
+            if len(in_files) == 1:
+                cube = iris.load_cube(
+                    in_files[0],
+                    constraint=NameConstraint(var_name=var['raw']),
+                )
+            elif var.get('operator', '') == 'sum':
+                # Multiple variables case using sum operation; summing the
+                # lazy arrays in a single stacked reduction keeps the data
+                # lazy and avoids one intermediate array per addition
+                cube = None
+                arrays = []
+                for raw_name, filename in zip(var['raw'], in_files):
+                    in_cube = iris.load_cube(
+                        filename,
+                        constraint=NameConstraint(var_name=raw_name),
+                    )
+                    if cube is None:
+                        cube = in_cube
+                    arrays.append(in_cube.lazy_data())
+                cube.data = da.stack(arrays, axis=0).sum(axis=0)
+            elif var.get('operator', '') == 'diff':
+                # two variables case using diff operation
+                cube = None
+                elements_var = len(var['raw'])
+                elements_files = len(in_files)
+                if (elements_var != 2) or (elements_files != 2):
+                    shortname = var.get('short_name')
+                    errmsg = (f'operator diff selected for variable '
+                              f'{shortname} expects exactly two input '
+                              f'variables and two input files')
+                    raise ValueError(errmsg)
+                cube = iris.load_cube(
+                    in_files[0],
+                    constraint=NameConstraint(var_name=var['raw'][0]),
+                )
+                cube2 = iris.load_cube(
+                    in_files[1],
+                    constraint=NameConstraint(var_name=var['raw'][1]),
+                )
+                cube -= cube2
+            else:
+                raise ValueError(
+                    "Multiple input files found, with operator '{}' "
+                    "configured: {}".format(var.get('operator'),
+                                            ', '.join(in_files)))
 
     return cube
 
@@ -392,8 +427,8 @@ def _extract_variable(in_files, var, cfg, out_dir):
                 var['short_name'], ', '.join(in_files))
     attributes = deepcopy(cfg['attributes'])
     attributes['mip'] = var['mip']
-    cmor_table = CMOR_TABLES[attributes['project_id']]
-    definition = cmor_table.get_variable(var['mip'], var['short_name'])
+    definition = _get_definition(attributes['project_id'], var['mip'],
+                                 var['short_name'])
 
     cube = _load_cube(in_files, var)
 
@@ -407,8 +442,9 @@ def _extract_variable(in_files, var, cfg, out_dir):
 
     _fix_units(cube, definition)
 
-    # Fix data type
-    cube.data = cube.core_data().astype('float32')
+    # Fix data type (lazily, so the cast happens chunk-by-chunk at save
+    # time and is fused with the unit scaling above)
+    cube.data = cube.lazy_data().astype(np.float32)
 
     cube = _fix_coordinates(cube, definition)
 
@@ -437,13 +473,20 @@ def _extract_variable(in_files, var, cfg, out_dir):
 
     logger.debug("Saving cube\n%s", cube)
     logger.debug("Expected output size is %.1fGB",
-                 np.prod(cube.shape) * 4 / 2**30)
+                 math.prod(cube.shape) * 4 / 2**30)
+    save_kwargs = {}
+    if cube.has_lazy_data():
+        # Write netCDF chunks matching the dask chunks so iris streams
+        # the lazy data chunk-by-chunk instead of realizing it all at once
+        save_kwargs['chunksizes'] = cube.lazy_data().chunksize
     utils.save_variable(
         cube,
         cube.var_name,
         out_dir,
         attributes,
         local_keys=['positive'],
+        zlib=True,
+        **save_kwargs,
     )
     logger.info("Finished CMORizing %s", ', '.join(in_files))
 
@@ -453,31 +496,51 @@ def _get_in_files_by_year(in_dir, var):
     if 'file' in var:
         var['files'] = [var.pop('file')]
 
+    # Scan the input directory once and match every pattern against the
+    # cached listing instead of re-globbing the directory per pattern
+    filenames = sorted(path.name for path in Path(in_dir).iterdir())
     in_files = defaultdict(list)
     for pattern in var['files']:
-        for filename in Path(in_dir).glob(pattern):
-            year = str(filename.stem).rsplit('_', maxsplit=1)[-1]
+        for name in fnmatch.filter(filenames, pattern):
+            filename = Path(in_dir, name)
+            year = filename.stem.rsplit('_', maxsplit=1)[-1]
             in_files[year].append(str(filename))
 
-    # Check if files are complete
-    for year in in_files.copy():
-        if len(in_files[year]) != len(var['files']):
-            logger.warning(
-                "Skipping CMORizing %s for year '%s', %s input files needed, "
-                "but found only %s", var['short_name'], year,
-                len(var['files']), ', '.join(in_files[year]))
-            in_files.pop(year)
+    # Check if files are complete; collect the incomplete years first so
+    # the mapping does not need to be copied just to mutate it
+    incomplete_years = [
+        year for year, files in in_files.items()
+        if len(files) != len(var['files'])
+    ]
+    for year in incomplete_years:
+        logger.warning(
+            "Skipping CMORizing %s for year '%s', %s input files needed, "
+            "but found only %s", var['short_name'], year,
+            len(var['files']), ', '.join(in_files.pop(year)))
 
     return in_files.values()
 
 
+def _init_worker():
+    """Use single-threaded dask inside pool worker processes.
+
+    The process pool already provides the parallelism; letting every
+    worker spawn its own dask thread pool on top of that oversubscribes
+    the CPUs.
+    """
+    dask.config.set(scheduler='synchronous')
+
+
 def _run(jobs, n_workers):
     """Run CMORization jobs using n_workers."""
-    if n_workers == 1:
+    # No point in spawning more worker processes than there are jobs
+    n_workers = min(n_workers, len(jobs))
+    if n_workers <= 1:
         for job in jobs:
             _extract_variable(*job)
     else:
-        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_worker) as executor:
             futures = {}
             for job in jobs:
                 future = executor.submit(_extract_variable, *job)
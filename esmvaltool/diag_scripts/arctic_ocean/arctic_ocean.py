@@ -28,13 +28,17 @@ See documentation
 import itertools
 import logging
 import os
-from collections import OrderedDict
+from functools import lru_cache
 
 import cartopy.crs as ccrs
 from matplotlib import cm
 import numpy as np
 
-from esmvaltool.diag_scripts.arctic_ocean.getdata import (aw_core, hofm_data,
+from joblib import Parallel, delayed
+
+from esmvaltool.diag_scripts.arctic_ocean.getdata import (aw_core,
+                                                          hofm_extract,
+                                                          hofm_save_data,
                                                           transect_data,
                                                           tsplot_data)
 from esmvaltool.diag_scripts.arctic_ocean.plotting import (
@@ -48,6 +52,37 @@ from esmvaltool.diag_scripts.shared import run_diagnostic
 
 logger = logging.getLogger(os.path.basename(__file__))
 
+# cache for the sorted model filename mappings, filled lazily by
+# `sorted_model_filenames`; every diagnostic block asks for the same
+# mapping, so scan the configuration only once per variable
+_FILENAMES_CACHE = {}
+
+
+def sorted_model_filenames(cfg, variable):
+    """Get model filenames for a variable, sorted by model name.
+
+    Results are cached, so repeated calls from the different diagnostic
+    blocks do not rebuild the mapping. Callers that want to modify the
+    returned dictionary should copy it first.
+    """
+    if variable not in _FILENAMES_CACHE:
+        model_filenames = get_clim_model_filenames(cfg, variable)
+        # plain dict keeps insertion order, no need for OrderedDict
+        _FILENAMES_CACHE[variable] = dict(sorted(model_filenames.items()))
+    return _FILENAMES_CACHE[variable]
+
+
+@lru_cache(maxsize=64)
+def contour_levels(vmin, vmax, sstep, roundlimit):
+    """Return rounded contour levels for the given colorbar limits.
+
+    The same limits are requested for every model and depth of a
+    variable, so the levels array is cached and the plotting reuses
+    one object instead of rebuilding it per plot. Callers must not
+    modify the returned array.
+    """
+    return np.round(np.linspace(vmin, vmax, sstep), roundlimit)
+
 
 def run_hofm_data(cfg):
     """Extract data for Hovmoeller diagrams.
@@ -71,22 +106,25 @@ def run_hofm_data(cfg):
         logger.info("Processing %s", hofm_var)
         # get dictionary with model names as key and path to the
         # preprocessed file as a value
-        model_filenames = get_clim_model_filenames(cfg, hofm_var)
-        model_filenames = OrderedDict(
-            sorted(model_filenames.items(), key=lambda t: t[0]))
-        # loop over regions and models
-        for mmodel, region in itertools.product(model_filenames,
-                                                cfg['hofm_regions']):
-            # actual extraction of the data for specific model and region
-            hofm_data(cfg, model_filenames, mmodel, hofm_var, region)
+        model_filenames = sorted_model_filenames(cfg, hofm_var)
+        # the models are independent, so the actual extraction of the
+        # data can run in parallel; each worker opens its model file
+        # once and extracts all regions from it in a single pass over
+        # the time steps.  The results are saved from the main process
+        # afterwards since writing provenance is not parallel-safe
+        results = Parallel(n_jobs=cfg['n_jobs'])(
+            delayed(hofm_extract)(cfg, model_filenames, mmodel, hofm_var,
+                                  cfg['hofm_regions'])
+            for mmodel in model_filenames)
+        for model_results in results:
+            for data_info, oce_hofm in model_results:
+                hofm_save_data(cfg, data_info, oce_hofm)
 
 
 def hofm_plot_params(cfg, hofm_var, var_number, observations):
     """Prepeare configuration for Hovmoeller plot."""
 
-    model_filenames = get_clim_model_filenames(cfg, hofm_var)
-    model_filenames = OrderedDict(
-        sorted(model_filenames.items(), key=lambda t: t[0]))
+    model_filenames = sorted_model_filenames(cfg, hofm_var)
     # remove "model" that contain observations,
     # since there will be no monthly data
     model_filenames = model_filenames.copy()
@@ -110,8 +148,7 @@ def hofm_plot_params(cfg, hofm_var, var_number, observations):
     plot_params['model_filenames'] = model_filenames
     plot_params['cmap'] = cmap
     plot_params['ncols'] = ncols
-    plot_params['levels'] = np.round(np.linspace(vmin, vmax, sstep),
-                                     roundlimit)
+    plot_params['levels'] = contour_levels(vmin, vmax, sstep, roundlimit)
     plot_params['observations'] = observations
 
     return plot_params
@@ -151,12 +188,7 @@ def run_mean(cfg, observations):
     """
     # loop over variables
     for hofm_var in cfg['hofm_vars']:
-        model_filenames = get_clim_model_filenames(
-            cfg,
-            hofm_var,
-        )
-        model_filenames = OrderedDict(
-            sorted(model_filenames.items(), key=lambda t: t[0]))
+        model_filenames = sorted_model_filenames(cfg, hofm_var)
         # loop over models
         for model in model_filenames:
             timmean(cfg,
@@ -169,9 +201,7 @@ def run_mean(cfg, observations):
 def plot_profile_params(cfg, hofm_var, observations):
     """Prepeare configuration for profile plot."""
 
-    model_filenames = get_clim_model_filenames(cfg, hofm_var)
-    model_filenames = OrderedDict(
-        sorted(model_filenames.items(), key=lambda t: t[0]))
+    model_filenames = sorted_model_filenames(cfg, hofm_var)
 
     plot_params = {}
 
@@ -206,9 +236,7 @@ def run_profiles(cfg, observations):
 def plot2d_params(cfg, plot2d_var, var_number):
     """Prepeare configuration for plot2d."""
 
-    model_filenames = get_clim_model_filenames(cfg, plot2d_var)
-    model_filenames = OrderedDict(
-        sorted(model_filenames.items(), key=lambda t: t[0]))
+    model_filenames = sorted_model_filenames(cfg, plot2d_var)
     # set the color map
     if cfg['plot2d_cmap']:
         cmap = get_cmap(cfg['plot2d_cmap'][var_number])
@@ -227,8 +255,7 @@ def plot2d_params(cfg, plot2d_var, var_number):
     plot_params['model_filenames'] = model_filenames
     plot_params['cmap'] = cmap
     plot_params['ncols'] = ncols
-    plot_params['levels'] = np.round(np.linspace(vmin, vmax, sstep),
-                                     roundlimit)
+    plot_params['levels'] = contour_levels(vmin, vmax, sstep, roundlimit)
     plot_params['dpi'] = 100
     plot_params['explicit_depths'] = None
     plot_params['projection'] = ccrs.NorthPolarStereo()
@@ -250,17 +277,17 @@ def run_plot2d(cfg):
 
         plot_params = plot2d_params(cfg, plot2d_var, var_number)
 
+        # one figure (axes, coastlines, colorbar) shared by all depths
+        fig_ctx = {}
         for depth in cfg['plot2d_depths']:
             plot_params['depth'] = depth
-            plot2d_original_grid(cfg, plot_params)
+            plot2d_original_grid(cfg, plot_params, fig_ctx=fig_ctx)
 
 
 def plot2d_bias_params(cfg, plot2d_bias_var, var_number, observations):
     """Prepeare configuration for plot2d bias."""
 
-    model_filenames = get_clim_model_filenames(cfg, plot2d_bias_var)
-    model_filenames = OrderedDict(
-        sorted(model_filenames.items(), key=lambda t: t[0]))
+    model_filenames = sorted_model_filenames(cfg, plot2d_bias_var)
     # setup the color map
     if cfg['plot2d_bias_cmap']:
         cmap = get_cmap(cfg['plot2d_bias_cmap'][var_number])
@@ -279,8 +306,7 @@ def plot2d_bias_params(cfg, plot2d_bias_var, var_number, observations):
     plot_params['model_filenames'] = model_filenames
     plot_params['cmap'] = cmap
     plot_params['ncols'] = ncols
-    plot_params['levels'] = np.round(np.linspace(vmin, vmax, sstep),
-                                     roundlimit)
+    plot_params['levels'] = contour_levels(vmin, vmax, sstep, roundlimit)
     plot_params['dpi'] = 100
     plot_params['observations'] = observations
     plot_params['projection'] = ccrs.NorthPolarStereo()
@@ -304,18 +330,17 @@ def run_plot2d_bias(cfg, observations):
         plot_params = plot2d_bias_params(cfg, plot2d_bias_var, var_number,
                                          observations)
 
-        # loop over depths
+        # loop over depths, reusing one figure across them
+        fig_ctx = {}
         for depth in cfg['plot2d_bias_depths']:
             plot_params['depth'] = depth
-            plot2d_bias(cfg, plot_params)
+            plot2d_bias(cfg, plot_params, fig_ctx=fig_ctx)
 
 
 def transect_plot_params(cfg, trans_var, var_number):
     """Prepeare configuration for transect plot."""
 
-    model_filenames = get_clim_model_filenames(cfg, trans_var)
-    model_filenames = OrderedDict(
-        sorted(model_filenames.items(), key=lambda t: t[0]))
+    model_filenames = sorted_model_filenames(cfg, trans_var)
     # loop over regions
     for mmodel, region in itertools.product(model_filenames,
                                             cfg['transects_regions']):
@@ -339,8 +364,7 @@ def transect_plot_params(cfg, trans_var, var_number):
     plot_params['model_filenames'] = model_filenames
     plot_params['cmap'] = cmap
     plot_params['ncols'] = ncols
-    plot_params['levels'] = np.round(np.linspace(vmin, vmax, sstep),
-                                     roundlimit)
+    plot_params['levels'] = contour_levels(vmin, vmax, sstep, roundlimit)
     plot_params['dpi'] = 100
     plot_params['projection'] = ccrs.NorthPolarStereo()
     plot_params['bbox'] = (-180, 180, 60, 90)
@@ -362,7 +386,8 @@ def run_transects(cfg):
                      region,
                      projection=ccrs.NorthPolarStereo(),
                      bbox=[-180, 180, 60, 90],
-                     mult=2)
+                     mult=2,
+                     fast_map=cfg.get('transects_fast_map', False))
     # loop over variables
     for var_number, trans_var in enumerate(cfg['transects_vars']):
 
@@ -382,9 +407,7 @@ def run_aw_core(cfg):
     cfg: dict
         configuration dictionary ESMValTool format.
     """
-    model_filenames = get_clim_model_filenames(cfg, 'thetao')
-    model_filenames = OrderedDict(
-        sorted(model_filenames.items(), key=lambda t: t[0]))
+    model_filenames = sorted_model_filenames(cfg, 'thetao')
     aw_core_parameters = aw_core(model_filenames, cfg['work_dir'], 'EB',
                                  'thetao')
     plot_aw_core_stat(aw_core_parameters, cfg['plot_dir'])
@@ -402,9 +425,7 @@ def run_aw_core_2d(cfg, aw_core_parameters):
         dictionary that contain AW core parameters generated
         by run_aw_core function.
     """
-    model_filenames = get_clim_model_filenames(cfg, 'thetao')
-    model_filenames = OrderedDict(
-        sorted(model_filenames.items(), key=lambda t: t[0]))
+    model_filenames = sorted_model_filenames(cfg, 'thetao')
     aw_core_parameters = aw_core(model_filenames, cfg['work_dir'], 'EB',
                                  'thetao')
     # this is now just using plot2d_original_grid with
@@ -415,7 +436,7 @@ def run_aw_core_2d(cfg, aw_core_parameters):
     plot_params['depth'] = 0
     plot_params['cmap'] = cm.Spectral_r
     plot_params['ncols'] = 4
-    plot_params['levels'] = np.round(np.linspace(-2, 2.3, 41), 1)
+    plot_params['levels'] = contour_levels(-2, 2.3, 41, 1)
     plot_params['dpi'] = 100
     plot_params['explicit_depths'] = aw_core_parameters
     plot_params['projection'] = ccrs.NorthPolarStereo()
@@ -428,9 +449,7 @@ def tsdiag_plot_parameters(cfg):
     """Prepeare configuration for TS plots."""
 
     # get the dictionary with model file names
-    model_filenames = get_clim_model_filenames(cfg, 'thetao')
-    model_filenames = OrderedDict(
-        sorted(model_filenames.items(), key=lambda t: t[0]))
+    model_filenames = sorted_model_filenames(cfg, 'thetao')
     # setting the number of columns for the plot
     if cfg['tsdiag_ncol']:
         ncols = cfg['tsdiag_ncol']
@@ -471,12 +490,12 @@ def run_tsdiag(cfg, observations):
 
 def main(cfg):
     """Compute the time average for each input model."""
-    # for debuging save the configuration in a pickle file
-    # with open('cfg_NK.joblib', 'wb') as handle:
-    #     pickle.dump(cfg, handle, protocol=pickle.HIGHEST_PROTOCOL)
-
     logger.info("Starting APPLICATE/TRR Arctic Ocean diagnostics")
 
+    # number of parallel processes used for the data extraction
+    cfg.setdefault('n_jobs', 1)
+    logger.info("Using at most %i processes", cfg['n_jobs'])
+
     # find the name of the observational dataset
     observations = find_observations_name(cfg)
     logger.info("Name of the Observations: %s{}", observations)
@@ -85,21 +85,38 @@ def load_meta(datapath, fxpath=None):
     return metadata
 
 
-def hofm_extract_region(metadata, cmor_var, indexes, level, time=0):
-    """Calculates mean over the region."""
+def hofm_read_slab(metadata, cmor_var, lev_limit, time=0):
+    """Read the (level, y, x) slab of one time step.
+
+    The slab is read from the netCDF file in one request instead of
+    one read per level, so it can be reduced for several regions
+    without re-reading.
+    """
     # fix for climatology
     if metadata['datafile'].variables[cmor_var].ndim < 4:
-        level_pp = metadata['datafile'].variables[cmor_var][level, :, :]
+        levels_pp = metadata['datafile'].variables[cmor_var][0:lev_limit]
     else:
-        level_pp = metadata['datafile'].variables[cmor_var][time, level, :, :]
-    if not isinstance(level_pp, np.ma.MaskedArray):
-        level_pp = np.ma.masked_equal(level_pp, 0)
-    data_mask = level_pp[indexes[0], indexes[1]].mask
+        levels_pp = metadata['datafile'].variables[cmor_var][time,
+                                                             0:lev_limit]
+    if not isinstance(levels_pp, np.ma.MaskedArray):
+        levels_pp = np.ma.masked_equal(levels_pp, 0)
+    return levels_pp
+
+
+def hofm_region_mean(metadata, levels_pp, indexes):
+    """Area-weighted means over the region for all levels of a slab."""
+    region_pp = levels_pp[:, indexes[0], indexes[1]]
+    area = metadata['areacello'][indexes[0], indexes[1]]
     area_masked = np.ma.masked_where(
-        data_mask, metadata['areacello'][indexes[0], indexes[1]])
-    result = (area_masked *
-              level_pp[indexes[0], indexes[1]]).sum() / area_masked.sum()
-    return result
+        np.ma.getmaskarray(region_pp),
+        np.broadcast_to(area, region_pp.shape))
+    return (area_masked * region_pp).sum(axis=1) / area_masked.sum(axis=1)
+
+
+def hofm_extract_region(metadata, cmor_var, indexes, lev_limit, time=0):
+    """Calculate means over the region for all levels of one time step."""
+    levels_pp = hofm_read_slab(metadata, cmor_var, lev_limit, time)
+    return hofm_region_mean(metadata, levels_pp, indexes)
 
 
 def hofm_save_data(cfg, data_info, oce_hofm):
@@ -133,33 +150,39 @@ def hofm_save_data(cfg, data_info, oce_hofm):
                               provenance_record)
 
 
-def hofm_data(cfg, model_filenames, mmodel, cmor_var, region):
-    """Extract data for Hovmoeller diagrams from monthly values.
+def hofm_extract(cfg, model_filenames, mmodel, cmor_var, regions):
+    """Extract mean vertical profiles for Hovmoeller diagrams.
 
-    Saves the data to files in `diagworkdir`.
+    Computational part of `hofm_data`. Returns the extracted data
+    instead of saving it, so several models can be processed in
+    parallel and the results (including provenance, which is not
+    parallel-safe) saved from the main process. All regions are
+    extracted in one pass: the model file is opened once and every
+    time-step slab is read once and reduced for each region, instead
+    of re-reading the file per region.
 
     Parameters
     ----------
-    model_filenames: OrderedDict
-        OrderedDict with model names as keys and input files as values.
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
     mmodel: str
         model name that will be processed.
     cmor_var: str
         name of the CMOR variable
-    areacello_fx: OrderedDict.
-        dictionary with model names as keys and paths to fx files as values.
-    max_level: float
-        maximum depth level the Hovmoeller diagrams should go to.
-    region: str
-        name of the region predefined in `hofm_regions` function.
-    diagworkdir: str
-        path to work directory.
+    regions: list of str
+        names of regions predefined in `hofm_regions` function.
+        A single region name is also accepted.
 
     Returns
     -------
-    None
+    list of (data_info, oce_hofm) tuples, one per region, where
+    data_info is the metadata expected by `hofm_save_data` and
+    oce_hofm the extracted data with dimensions (level, time).
     """
-    logger.info("Extract  %s data for %s, region %s", cmor_var, mmodel, region)
+    if isinstance(regions, str):
+        regions = [regions]
+    logger.info("Extract  %s data for %s, regions %s", cmor_var, mmodel,
+                regions)
     areacello_fx = get_fx_filenames(cfg, 'areacello')
     metadata = load_meta(datapath=model_filenames[mmodel],
                          fxpath=areacello_fx[mmodel])
@@ -167,30 +190,73 @@ def hofm_data(cfg, model_filenames, mmodel, cmor_var, region):
     lev_limit = metadata['lev'][
         metadata['lev'] <= cfg['hofm_depth']].shape[0] + 1
 
-    indexes = hofm_regions(region, metadata['lon2d'], metadata['lat2d'])
+    indexes = {
+        region: hofm_regions(region, metadata['lon2d'], metadata['lat2d'])
+        for region in regions
+    }
 
     series_lenght = get_series_lenght(metadata['datafile'], cmor_var)
 
-    oce_hofm = np.zeros((metadata['lev'][0:lev_limit].shape[0], series_lenght))
+    nlev = metadata['lev'][0:lev_limit].shape[0]
+    oce_hofm = {
+        region: np.zeros((nlev, series_lenght))
+        for region in regions
+    }
     for mon in range(series_lenght):
-        for ind, _ in enumerate(metadata['lev'][0:lev_limit]):
-            oce_hofm[ind, mon] = hofm_extract_region(metadata, cmor_var,
-                                                     indexes, ind, mon)
-    data_info = {}
-    data_info['basedir'] = cfg['work_dir']
-    data_info['variable'] = cmor_var
-    data_info['mmodel'] = mmodel
-    data_info['region'] = region
-    data_info['time'] = metadata['time']
-    data_info['levels'] = metadata['lev']
-    data_info['lev_limit'] = lev_limit
-    data_info['ori_file'] = model_filenames[mmodel]
-    data_info['areacello'] = areacello_fx[mmodel]
-
-    hofm_save_data(cfg, data_info, oce_hofm)
+        levels_pp = hofm_read_slab(metadata, cmor_var, lev_limit, mon)
+        for region in regions:
+            oce_hofm[region][:, mon] = hofm_region_mean(
+                metadata, levels_pp, indexes[region])
+
+    results = []
+    for region in regions:
+        data_info = {}
+        data_info['basedir'] = cfg['work_dir']
+        data_info['variable'] = cmor_var
+        data_info['mmodel'] = mmodel
+        data_info['region'] = region
+        data_info['time'] = metadata['time']
+        data_info['levels'] = metadata['lev']
+        data_info['lev_limit'] = lev_limit
+        data_info['ori_file'] = model_filenames[mmodel]
+        data_info['areacello'] = areacello_fx[mmodel]
+        results.append((data_info, oce_hofm[region]))
 
     metadata['datafile'].close()
 
+    return results
+
+
+def hofm_data(cfg, model_filenames, mmodel, cmor_var, region):
+    """Extract data for Hovmoeller diagrams from monthly values.
+
+    Saves the data to files in `diagworkdir`.
+
+    Parameters
+    ----------
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
+    mmodel: str
+        model name that will be processed.
+    cmor_var: str
+        name of the CMOR variable
+    areacello_fx: dict.
+        dictionary with model names as keys and paths to fx files as values.
+    max_level: float
+        maximum depth level the Hovmoeller diagrams should go to.
+    region: str
+        name of the region predefined in `hofm_regions` function.
+    diagworkdir: str
+        path to work directory.
+
+    Returns
+    -------
+    None
+    """
+    for data_info, oce_hofm in hofm_extract(cfg, model_filenames, mmodel,
+                                            cmor_var, [region]):
+        hofm_save_data(cfg, data_info, oce_hofm)
+
 
 def transect_level(datafile, cmor_var, level, grid, locstream):
     """Interpolation for one level of transect."""
@@ -344,15 +410,18 @@ def transect_data(cfg, mmodel, cmor_var, region, mult=2):
     datafile.close()
 
 
-def tsplot_extract_data(mmodel, observations, metadata_t, metadata_s, ind):
-    """Extracts level data from the files for TS plots."""
+def tsplot_extract_data(mmodel, observations, metadata_t, metadata_s,
+                        lev_limit):
+    """Extracts level data from the files for TS plots.
 
+    All levels up to `lev_limit` are read in one request.
+    """
     if mmodel != observations:
-        level_pp = metadata_t['datafile'].variables['thetao'][0, ind, :, :]
-        level_pp_s = metadata_s['datafile'].variables['so'][0, ind, :, :]
+        level_pp = metadata_t['datafile'].variables['thetao'][0, 0:lev_limit]
+        level_pp_s = metadata_s['datafile'].variables['so'][0, 0:lev_limit]
     else:
-        level_pp = metadata_t['datafile'].variables['thetao'][0, ind, :, :]
-        level_pp_s = metadata_s['datafile'].variables['so'][0, ind, :, :]
+        level_pp = metadata_t['datafile'].variables['thetao'][0, 0:lev_limit]
+        level_pp_s = metadata_s['datafile'].variables['so'][0, 0:lev_limit]
     # This is fix fo make models with 0 as missing values work,
     # should be fixed in fixes that do not work for now in the new backend
     if not isinstance(level_pp, np.ma.MaskedArray):
@@ -434,21 +503,21 @@ def tsplot_data(cfg, mmodel, region, observations='PHC'):
     # find indexes of data that are in the region
     indexes = hofm_regions(region, metadata_t['lon2d'], metadata_t['lat2d'])
 
-    temp = np.array([])
-    salt = np.array([])
-    depth_model = np.array([])
-    # loop over depths
-    for ind, depth in enumerate(metadata_t['lev'][0:lev_limit]):
-        level_pp, level_pp_s = tsplot_extract_data(mmodel, observations,
-                                                   metadata_t, metadata_s, ind)
-        # select individual points for T, S and depth
-        temp = np.hstack((temp, level_pp[indexes[0], indexes[1]].compressed()))
-        salt = np.hstack(
-            (salt, level_pp_s[indexes[0], indexes[1]].compressed()))
-        depth_temp = np.zeros_like(
-            level_pp[indexes[0], indexes[1]].compressed())
-        depth_temp[:] = depth
-        depth_model = np.hstack((depth_model, depth_temp))
+    # read all levels at once and select the region points; compressing
+    # the (level, point) selections flattens them level-major, exactly
+    # as the old per-level loop with its repeated hstack did
+    level_pp, level_pp_s = tsplot_extract_data(mmodel, observations,
+                                               metadata_t, metadata_s,
+                                               lev_limit)
+    region_temp = level_pp[:, indexes[0], indexes[1]]
+    region_salt = level_pp_s[:, indexes[0], indexes[1]]
+    depth2d = np.broadcast_to(
+        np.ma.getdata(metadata_t['lev'])[0:lev_limit, None],
+        region_temp.shape)
+    temp = region_temp.compressed()
+    salt = region_salt.compressed()
+    depth_model = np.ma.masked_where(np.ma.getmaskarray(region_temp),
+                                     depth2d).compressed()
 
     # Saves the data to individual files
     data_info = {}
@@ -476,8 +545,8 @@ def aw_core(model_filenames, diagworkdir, region, cmor_var):
 
     Parameters
     ----------
-    model_filenames: OrderedDict
-        OrderedDict with model names as keys and input files as values.
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
     diagworkdir: str
         path to work directory.
     region: str
@@ -34,8 +34,8 @@ def create_plot(model_filenames, ncols=3, projection=None, nplots_increment=0):
 
     Parameters
     ----------
-    model_filenames: OrderedDict
-        OrderedDict with model names as keys and input files as values.
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
     ncols: int
         Number of columns in the plot. The number of rows
         will be calculated authomatically.
@@ -127,8 +127,8 @@ def hofm_plot(cfg, plot_params):
 
     Parameters
     ----------
-    model_filenames: OrderedDict
-        OrderedDict with model names as keys and input files as values.
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
     cmor_var: str
         name of the CMOR variable
     max_level: float
@@ -240,8 +240,8 @@ def tsplot_plot(cfg, plot_params):
 
     Parameters
     ----------
-    model_filenames: OrderedDict
-        OrderedDict with model names as keys and input files as values.
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
     max_level: float
         maximum depth level the TS plot shoud go.
     region: str
@@ -352,8 +352,8 @@ def plot_profile(cfg, plot_params):
 
     Parameters
     ----------
-    model_filenames: OrderedDict
-        OrderedDict with model names as keys and input files as values.
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
     cmor_var: str
         name of the CMOR variable
     region: str
@@ -464,13 +464,13 @@ def plot_profile(cfg, plot_params):
         provenance_logger.log(pltoutname + '.png', provenance_record)
 
 
-def plot2d_original_grid(cfg, plot_params):
+def plot2d_original_grid(cfg, plot_params, fig_ctx=None):
     """Plot 2d maps on original grid using cartopy.
 
     Parameters
     ----------
-    model_filenames:OrderedDict
-        OrderedDict with model names as keys and input files as values.
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
     cmor_var: str
         name of the variable
     depth: int
@@ -497,14 +497,26 @@ def plot2d_original_grid(cfg, plot_params):
         bounding box. It will be the input for cartopy `set_extent`.
     ncols: int
         number of columns.
+    fig_ctx: dict, optional
+        figure context shared between calls for different depths.
+        Pass the same (initially empty) dictionary to each call: the
+        first call fills it with the figure, axes and quadmeshes, later
+        calls only update the mesh data instead of redrawing the axes,
+        coastlines and colorbar from scratch.
 
     Retuns
     ------
     None
     """
-    figure, axis = create_plot(plot_params['model_filenames'],
-                               ncols=plot_params['ncols'],
-                               projection=plot_params['projection'])
+    reuse = bool(fig_ctx) and 'figure' in fig_ctx
+    if reuse:
+        figure, axis = fig_ctx['figure'], fig_ctx['axis']
+    else:
+        figure, axis = create_plot(plot_params['model_filenames'],
+                                   ncols=plot_params['ncols'],
+                                   projection=plot_params['projection'])
+        if fig_ctx is not None:
+            fig_ctx['images'] = []
     index = None
     for index, mmodel in enumerate(plot_params['model_filenames']):
         logger.info("Plot plot2d_original_grid %s for %s",
@@ -541,42 +553,53 @@ def plot2d_original_grid(cfg, plot_params):
 
         left, right, down, upper = plot_params['bbox']
 
-        axis[index].set_extent([left, right, down, upper],
-                               crs=ccrs.PlateCarree())
-        # Only pcolormesh is working for now with cartopy,
-        # contourf is failing to plot curvilinear meshes,
-        # let along the unstructures ones.
-        image = axis[index].pcolormesh(
-            lon2d,
-            lat2d,
-            data,
-            vmin=plot_params['levels'][0],
-            vmax=plot_params['levels'][-1],
-            transform=ccrs.PlateCarree(),
-            cmap=plot_params['cmap'],
-        )
-
-        axis[index].add_feature(
-            cfeature.GSHHSFeature(levels=[1],
-                                  scale="low",
-                                  facecolor="lightgray"))
+        if reuse:
+            # the grid is unchanged, only swap the data on the mesh
+            image = fig_ctx['images'][index]
+            image.set_array(data.ravel())
+        else:
+            axis[index].set_extent([left, right, down, upper],
+                                   crs=ccrs.PlateCarree())
+            # Only pcolormesh is working for now with cartopy,
+            # contourf is failing to plot curvilinear meshes,
+            # let along the unstructures ones.
+            image = axis[index].pcolormesh(
+                lon2d,
+                lat2d,
+                data,
+                vmin=plot_params['levels'][0],
+                vmax=plot_params['levels'][-1],
+                transform=ccrs.PlateCarree(),
+                cmap=plot_params['cmap'],
+            )
+
+            axis[index].add_feature(
+                cfeature.GSHHSFeature(levels=[1],
+                                      scale="low",
+                                      facecolor="lightgray"))
+            axis[index].set_rasterization_zorder(-1)
+            if fig_ctx is not None:
+                fig_ctx['images'].append(image)
         axis[index].set_title("{}, {} m".format(mmodel,
                                                 np.round(depth_target, 1)),
                               size=18)
-        axis[index].set_rasterization_zorder(-1)
 
-    # delete unused axis
-    for delind in range(index + 1, len(axis)):
-        figure.delaxes(axis[delind])
-
-    # set common colorbar
-    colorbar = figure.colorbar(image,
-                               orientation='horizontal',
-                               ax=axis,
-                               pad=0.01,
-                               shrink=0.9)
-    colorbar.set_label(cb_label, rotation='horizontal', size=18)
-    colorbar.ax.tick_params(labelsize=18)
+    if not reuse:
+        # delete unused axis
+        for delind in range(index + 1, len(axis)):
+            figure.delaxes(axis[delind])
+
+        # set common colorbar
+        colorbar = figure.colorbar(image,
+                                   orientation='horizontal',
+                                   ax=axis,
+                                   pad=0.01,
+                                   shrink=0.9)
+        colorbar.set_label(cb_label, rotation='horizontal', size=18)
+        colorbar.ax.tick_params(labelsize=18)
+        if fig_ctx is not None:
+            fig_ctx['figure'] = figure
+            fig_ctx['axis'] = axis
 
     if not plot_params['explicit_depths']:
         plot_type = 'plot2d_{}_depth'.format(str(plot_params['depth']))
@@ -594,20 +617,20 @@ def plot2d_original_grid(cfg, plot_params):
     plot_params['areacello'] = None
     plot_params['mmodel'] = None
     plot_params['region'] = "Global"
-    plt.savefig(pltoutname, dpi=plot_params['dpi'])
+    figure.savefig(pltoutname, dpi=plot_params['dpi'])
 
     provenance_record = get_provenance_record(plot_params, 'plot2d', 'png')
     with ProvenanceLogger(cfg) as provenance_logger:
         provenance_logger.log(pltoutname + '.png', provenance_record)
 
 
-def plot2d_bias(cfg, plot_params):
+def plot2d_bias(cfg, plot_params, fig_ctx=None):
     """Plot 2d maps of the bias relative to climatology.
 
     Parameters
     ----------
-    model_filenames:OrderedDict
-        OrderedDict with model names as keys and input files as values.
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
     cmor_var: str
         name of the variable
     depth: int
@@ -628,15 +651,30 @@ def plot2d_bias(cfg, plot_params):
         bounding box. It will be the input for cartopy `set_extent`.
     ncols: int
         number of columns.
+    fig_ctx: dict, optional
+        figure context shared between calls for different depths.
+        Pass the same (initially empty) dictionary to each call: the
+        first call fills it with the figure, axes and contour sets,
+        later calls remove the old contours and redraw only the data,
+        keeping the axes, coastlines and colorbar.
 
     Retuns
     ------
     None
     """
     # setupa a base figure
-    figure, axis = create_plot(plot_params['model_filenames'],
-                               ncols=plot_params['ncols'],
-                               projection=plot_params['projection'])
+    reuse = bool(fig_ctx) and 'figure' in fig_ctx
+    if reuse:
+        figure, axis = fig_ctx['figure'], fig_ctx['axis']
+        for old_image in fig_ctx['images']:
+            old_image.remove()
+        fig_ctx['images'] = []
+    else:
+        figure, axis = create_plot(plot_params['model_filenames'],
+                                   ncols=plot_params['ncols'],
+                                   projection=plot_params['projection'])
+        if fig_ctx is not None:
+            fig_ctx['images'] = []
     # get the filename of observations
     ifilename_obs = genfilename(cfg['work_dir'],
                                 plot_params['variable'],
@@ -682,8 +720,9 @@ def plot2d_bias(cfg, plot_params):
         model_mean = model_mean + interpolated
         # set the map extent
         left, right, down, upper = plot_params['bbox']
-        axis[index].set_extent([left, right, down, upper],
-                               crs=ccrs.PlateCarree())
+        if not reuse:
+            axis[index].set_extent([left, right, down, upper],
+                                   crs=ccrs.PlateCarree())
         # Only pcolormesh is working for now with cartopy,
         # contourf is failing to plot curvilinear meshes,
         # let along the unstructures ones.
@@ -698,23 +737,27 @@ def plot2d_bias(cfg, plot_params):
             transform=ccrs.PlateCarree(),
             cmap=plot_params['cmap'],
         )
-        # fill continents
-        axis[index].add_feature(
-            cfeature.GSHHSFeature(levels=[1],
-                                  scale="low",
-                                  facecolor="lightgray"))
+        if fig_ctx is not None:
+            fig_ctx['images'].append(image)
+        if not reuse:
+            # fill continents
+            axis[index].add_feature(
+                cfeature.GSHHSFeature(levels=[1],
+                                      scale="low",
+                                      facecolor="lightgray"))
+            axis[index].set_rasterization_zorder(-1)
 
         axis[index].set_title("{}, {} m".format(mmodel, int(target_depth)),
                               size=18)
-        axis[index].set_rasterization_zorder(-1)
     # calculate the model mean and plot it
     if index:
         index = index
     else:
         index = 0
     model_mean = model_mean / len(model_filenames)
-    axis[index + 1].set_extent([left, right, down, upper],
-                               crs=ccrs.PlateCarree())
+    if not reuse:
+        axis[index + 1].set_extent([left, right, down, upper],
+                                   crs=ccrs.PlateCarree())
     image = axis[index + 1].contourf(
         lonc,
         latc,
@@ -726,25 +769,32 @@ def plot2d_bias(cfg, plot_params):
         transform=ccrs.PlateCarree(),
         cmap=cmo.balance,
     )
-
-    axis[index + 1].add_feature(
-        cfeature.GSHHSFeature(levels=[1], scale="low", facecolor="lightgray"))
+    if fig_ctx is not None:
+        fig_ctx['images'].append(image)
 
     axis[index + 1].set_title("Model mean bias, {} m".format(
         int(target_depth)),
                               size=18)
-    axis[index + 1].set_rasterization_zorder(-1)
-    # delete the axis that are not needed
-    for delind in range(index + 2, len(axis)):
-        figure.delaxes(axis[delind])
-    # set common colorbar
-    colorbar = figure.colorbar(image,
-                               orientation='horizontal',
-                               ax=axis,
-                               pad=0.01,
-                               shrink=0.9)
-    colorbar.set_label(cb_label, rotation='horizontal', size=18)
-    colorbar.ax.tick_params(labelsize=18)
+    if not reuse:
+        axis[index + 1].add_feature(
+            cfeature.GSHHSFeature(levels=[1],
+                                  scale="low",
+                                  facecolor="lightgray"))
+        axis[index + 1].set_rasterization_zorder(-1)
+        # delete the axis that are not needed
+        for delind in range(index + 2, len(axis)):
+            figure.delaxes(axis[delind])
+        # set common colorbar
+        colorbar = figure.colorbar(image,
+                                   orientation='horizontal',
+                                   ax=axis,
+                                   pad=0.01,
+                                   shrink=0.9)
+        colorbar.set_label(cb_label, rotation='horizontal', size=18)
+        colorbar.ax.tick_params(labelsize=18)
+        if fig_ctx is not None:
+            fig_ctx['figure'] = figure
+            fig_ctx['axis'] = axis
     # save the picture
     pltoutname = genfilename(cfg['plot_dir'],
                              plot_params['variable'],
@@ -757,7 +807,7 @@ def plot2d_bias(cfg, plot_params):
     plot_params['areacello'] = None
     plot_params['mmodel'] = None
     plot_params['region'] = "Global"
-    plt.savefig(pltoutname, dpi=plot_params['dpi'])
+    figure.savefig(pltoutname, dpi=plot_params['dpi'])
 
     provenance_record = get_provenance_record(plot_params, 'plot2d_bias',
                                               'png')
@@ -815,7 +865,8 @@ def transect_map(cfg,
                  region,
                  projection=ccrs.NorthPolarStereo(),
                  bbox=(-180, 180, 60, 90),
-                 mult=2):
+                 mult=2,
+                 fast_map=False):
     """Plot the map with points of the transect overlayed.
 
     Parameters
@@ -831,6 +882,11 @@ def transect_map(cfg,
     mult: int
         miltiplicator for the number of points.
         E.g. mult=2 increase the number of points 2 times.
+    fast_map: bool
+        plot on plain PlateCarree with a latitude-corrected aspect
+        ratio instead of `projection`. Faster, since coastlines and
+        points need no reprojection, at the cost of a distorted view
+        of the pole.
 
     Returns
     -------
@@ -840,12 +896,19 @@ def transect_map(cfg,
     logger.info("Create transect map for region %s", region)
     lon_s4new, lat_s4new = transect_points(region, mult=mult)
     dist = point_distance(lon_s4new, lat_s4new)
+    if fast_map:
+        projection = ccrs.PlateCarree()
     figure, axis = plt.subplots(1,
                                 1,
                                 subplot_kw=dict(projection=projection),
                                 constrained_layout=True)
 
     axis.set_extent(bbox, crs=ccrs.PlateCarree())
+    if fast_map:
+        # mimic the degree-length ratio at the central latitude
+        axis.set_aspect(
+            1. / (110.574 / 111.320 *
+                  np.cos(np.deg2rad(np.mean(bbox[2:])))))
     image = axis.scatter(lon_s4new,
                          lat_s4new,
                          s=10,
@@ -884,8 +947,8 @@ def transect_plot(cfg, plot_params):
 
     Parameters
     ----------
-    model_filenames:OrderedDict
-        OrderedDict with model names as keys and input files as values.
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
     cmor_var: str
         name of the variable
     region: str
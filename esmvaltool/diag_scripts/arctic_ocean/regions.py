@@ -5,6 +5,8 @@ This module contains functions with definitions of regions.
 """
 import logging
 import os
+from functools import lru_cache
+
 import numpy as np
 from scipy.interpolate import interp1d
 
@@ -64,9 +66,14 @@ def hofm_regions(region, lon2d, lat2d):
     return indexesi, indexesj
 
 
+@lru_cache(maxsize=32)
 def transect_points(transect, mult=2):
     """Return a collection of points for transect.
 
+    The points only depend on the transect name, not on the model, so
+    the result is cached and reused when the same transect is processed
+    for several models. Callers must not modify the returned arrays.
+
     Parameters
     ----------
     transect: str
@@ -77,8 +77,8 @@ def timmean(cfg, model_filenames, mmodel, cmor_var, observations='PHC'):
     ----------
     cfg: dict
         configuration dictionary ESMValTool format.
-    model_filenames: OrderedDict
-        OrderedDict with model names as keys and input files as values.
+    model_filenames: dict
+        dictionary with model names as keys and input files as values.
     mmodel: str
         model name that will be processed
     cmor_var: str
@@ -42,7 +42,7 @@ REQUIREMENTS = {
         'joblib',
         'lime',
         'mapgenerator>=1.0.5',
-        'matplotlib',
+        'matplotlib>=3.8',  # removable ContourSet in arctic_ocean plots
         'natsort',
         'nc-time-axis',
         'netCDF4',
@@ -66,7 +66,7 @@ REQUIREMENTS = {
         'scikit-image',
         'scikit-learn>=1.4.0',  # github.com/ESMValGroup/ESMValTool/issues/3504
         'scipy',
-        'scitools-iris>=3.6.1',
+        'scitools-iris>=3.8.0',  # CHUNK_CONTROL in era_interim cmorizer
         'seaborn',
         'seawater',
         'shapely>=2',